@@ -11,7 +11,13 @@ __status__ = 'Production'
 
 import os
 import re
-from typing import List, Dict, Any, Literal
+import sys
+import copy
+import hashlib
+import tomllib
+from functools import lru_cache, partial
+from pathlib import Path
+from typing import List, Dict, Tuple, Any, Callable, Literal
 from benedict import benedict
 
 from loguru import logger
@@ -19,7 +25,301 @@ from loguru import logger
 
 DEFAULT_FORMAT = 'toml'
 DEFAULT_CONFIG = benedict()
-VALIDATORS = {}
+_VALIDATED_CONFIG_REF = DEFAULT_CONFIG
+_LAZY_VALIDATORS: Dict[str, int] = {}
+_TOML_CACHE: Dict[str, Tuple[int, int, bytes, dict]] = {}
+_MISSING = object()
+_DEFAULTS_VERSION = 0
+
+
+@lru_cache(maxsize=32)
+def _section_matcher(sections: tuple) -> Callable[[str], Any]:
+    """
+    Returns a matcher for the configuration file names of the given sections.
+
+    Sections are literal names, or name families using '*' as wildcard for a single key (e.g. 'db.*').
+
+    :param sections: A tuple of section names.
+
+    :return: A callable returning a truthy value for matching file names.
+    :rtype: Callable[[str], Any]
+    """
+    if not any('*' in s for s in sections):
+        return frozenset(f'{s}.toml' for s in sections).__contains__
+
+    alternatives = '|'.join(re.escape(s).replace(r'\*', r'[^.]*') for s in sections)
+    return re.compile(fr'^(?:{alternatives})\.toml\Z').match
+
+
+@lru_cache(maxsize=1024)
+def _split_key(keypath: str) -> Tuple[str, ...]:
+    """
+    Splits a keypath into its keys.
+
+    :param keypath: A dot-separated keypath, e.g. 'config.directory'.
+
+    :return: The tuple of keys.
+    :rtype: Tuple[str, ...]
+    """
+    return tuple(sys.intern(key) for key in keypath.split('.'))
+
+
+def _split_args(args: tuple) -> Tuple[Any, ...]:
+    """
+    Returns the keys designated by get/set arguments, e.g. ('db', 'host') for 'db.host', ('db', 'host')
+    or (['db', 'host'],).
+
+    :param args: The keys, keypaths or lists of keys given by the caller.
+
+    :return: The tuple of keys.
+    :rtype: Tuple[Any, ...]
+    """
+    if len(args) == 1 and isinstance(args[0], str):
+        return _split_key(args[0])
+
+    keys = []
+    for arg in args:
+        if isinstance(arg, (list, tuple)):
+            keys.extend(arg)
+        else:
+            keys.append(arg)
+    if not keys or not all(isinstance(key, str) for key in keys):
+        return tuple(keys)
+    if any('.' in key for key in keys):
+        return _split_key('.'.join(keys))
+
+    return (sys.intern(keys[0]),) + tuple(keys[1:])
+
+
+def _needs_benedict(keys: Tuple[Any, ...]) -> bool:
+    """
+    Tells whether keys can only be understood by benedict keypaths, e.g. with list indexes.
+
+    :param keys: The keys returned by _split_args.
+
+    :return: True if the keys must be handed to benedict.
+    :rtype: bool
+    """
+    return not keys or any(not isinstance(key, str) or '[' in key for key in keys)
+
+
+def _get_path(data: dict, keys: Tuple[str, ...], default: Any = _MISSING) -> Any:
+    """
+    Walks nested dicts along the given keys, without any keypath parsing.
+
+    :param data: The (possibly nested) dict to walk.
+    :param keys: The keys to follow.
+    :param default: The value returned at the first missing key.
+
+    :return: The value found, or the default.
+    """
+    node = data
+    for key in keys:
+        if isinstance(node, benedict):
+            node = node.dict()
+        if not isinstance(node, dict):
+            return default
+        node = node.get(key, _MISSING)
+        if node is _MISSING:
+            return default
+
+    return node
+
+
+def _check_keys(value: Any):
+    """
+    Checks that the keys of nested dicts do not contain the keypath separator, as benedict does.
+
+    :param value: The value to check.
+
+    :raises ValueError: If a key contains the keypath separator.
+    """
+    stack = [ value ]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, benedict):
+            node = node.dict()
+        if isinstance(node, dict):
+            for key, child in node.items():
+                if isinstance(key, str) and '.' in key:
+                    raise ValueError(f"Key should not contain keypath separator '.', found: {key!r}.")
+                stack.append(child)
+        elif isinstance(node, (list, tuple)):
+            stack.extend(node)
+
+
+def _set_path(data: dict, keys: Tuple[str, ...], value: Any):
+    """
+    Sets a value in nested dicts along the given keys, creating the missing dicts.
+
+    :param data: The (possibly nested) dict to update.
+    :param keys: The keys to follow.
+    :param value: The value to set, stored as a plain dict if it is a benedict.
+
+    :raises ValueError: If a key of the value contains the keypath separator.
+    """
+    _check_keys(value)
+    if isinstance(value, benedict):
+        value = value.dict()
+    node = data.dict() if isinstance(data, benedict) else data
+    for key in keys[:-1]:
+        child = node.get(key)
+        if isinstance(child, benedict):
+            child = child.dict()
+        if not isinstance(child, dict):
+            child = node[key] = {}
+        node = child
+
+    node[keys[-1]] = value
+
+
+def _match_tables(data: dict, pattern: Tuple[str, ...]) -> List[str]:
+    """
+    Returns the keypaths of the tables matching a section family, e.g. ['db.main', 'db.replica'] for 'db.*'.
+
+    Only the nodes along the pattern are walked: the literal prefix directly, then the children of each node.
+
+    :param data: The (possibly nested) dict to search.
+    :param pattern: The keys of the family, '*' being a wildcard within a key.
+
+    :return: The keypaths of the matching tables.
+    :rtype: List[str]
+    """
+    prefix = 0
+    while prefix < len(pattern) and '*' not in pattern[prefix]:
+        prefix += 1
+    node = _get_path(data, pattern[:prefix], default=None)
+    nodes = [ (pattern[:prefix], node) ] if isinstance(node, dict) else []
+    for key in pattern[prefix:]:
+        matcher = re.compile(re.escape(key).replace(r'\*', '.*') + r'\Z').match
+        matched = []
+        for keys, node in nodes:
+            if isinstance(node, benedict):
+                node = node.dict()
+            for child_key, child in node.items():
+                if isinstance(child, dict) and isinstance(child_key, str) and matcher(child_key):
+                    matched.append((keys + (child_key,), child))
+        nodes = matched
+
+    return [ '.'.join(keys) for keys, _ in nodes ]
+
+
+def _leaves(data: dict):
+    """
+    Yields the leaves of nested dicts along with the keys leading to them.
+
+    :param data: The (possibly nested) dict to walk.
+
+    :return: A generator of (keys, value) tuples.
+    """
+    stack = [ ((), data) ]
+    while stack:
+        prefix, node = stack.pop()
+        for key, value in node.items():
+            if isinstance(value, benedict):
+                value = value.dict()
+            if isinstance(value, dict):
+                stack.append((prefix + (key,), value))
+            else:
+                yield prefix + (key,), value
+
+
+def _deep_merge(dst: dict, src: dict) -> dict:
+    """
+    Merges nested dicts into another one, sub-dicts being merged together.
+
+    The dicts and lists of the source are copied, so it is never modified through the destination.
+
+    :param dst: The dict to merge into.
+    :param src: The dict to merge.
+
+    :return: The destination dict.
+    :rtype: dict
+    """
+    stack = [ (dst, src) ]
+    while stack:
+        d, s = stack.pop()
+        for key, value in s.items():
+            if isinstance(value, benedict):
+                value = value.dict()
+            if isinstance(value, dict):
+                target = d.get(key)
+                if isinstance(target, benedict):
+                    target = target.dict()
+                if not isinstance(target, dict):
+                    target = d[key] = {}
+                stack.append((target, value))
+            else:
+                d[key] = copy.deepcopy(value) if isinstance(value, list) else value
+
+    return dst
+
+
+def _intern_keys(data: dict) -> dict:
+    """
+    Rebuilds nested dicts with interned string keys.
+
+    :param data: The (possibly nested) dict to rebuild.
+
+    :return: The rebuilt dict.
+    :rtype: dict
+    """
+    root = {}
+    stack = [ (data, root) ]
+    while stack:
+        src, dst = stack.pop()
+        for key, value in src.items():
+            key = sys.intern(key) if isinstance(key, str) else key
+            if isinstance(value, dict):
+                dst[key] = {}
+                stack.append((value, dst[key]))
+            else:
+                dst[key] = value
+
+    return root
+
+
+def _file_signature(path: str) -> Tuple[int, int] | Tuple[()]:
+    """
+    Returns the modification time and size of a file, used to detect files changed on disk.
+
+    :param path: The path to the file.
+
+    :return: The (st_mtime_ns, st_size) tuple, or an empty tuple if the file does not exist.
+    :rtype: Tuple[int, int] | Tuple[()]
+    """
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return ()
+
+    return st.st_mtime_ns, st.st_size
+
+
+def _load_toml(path: str, st: os.stat_result | None = None) -> Tuple[bytes, dict]:
+    """
+    Loads a TOML file, reusing the previously parsed content if the file is unchanged.
+
+    :param path: The path to the TOML file.
+    :param st: The stat of the file, if already known.
+
+    :return: The digest of the file content and the parsed content, shared with the cache:
+             merge it with _deep_merge, never modify it.
+    :rtype: Tuple[bytes, dict]
+    """
+    st = st or os.stat(path)
+    entry = _TOML_CACHE.get(path)
+    if entry and entry[0] == st.st_mtime_ns and entry[1] == st.st_size:
+        return entry[2], entry[3]
+
+    with open(path, 'rb') as fh:
+        raw = fh.read()
+    digest = hashlib.blake2b(raw, digest_size=16).digest()
+    # Keys are repeated across files and lookups, interning them once saves memory and speeds up comparisons
+    parsed = _intern_keys(tomllib.loads(raw.decode('utf-8')))
+    _TOML_CACHE[path] = (st.st_mtime_ns, st.st_size, digest, parsed)
+
+    return digest, parsed
 
 
 def extend_default_config(config: dict):
@@ -28,7 +328,10 @@ def extend_default_config(config: dict):
 
     :param config: A dictionary containing configuration settings to be merged.
     """
-    DEFAULT_CONFIG.merge(benedict(config))
+    global _DEFAULTS_VERSION
+
+    DEFAULT_CONFIG.merge(config if isinstance(config, benedict) else benedict(config))
+    _DEFAULTS_VERSION += 1
 
 
 def extend_default_validators(config: dict):
@@ -41,16 +344,75 @@ def extend_default_validators(config: dict):
     :return: None
     :rtype: None
     """
-    for part in config.keys():
-        def valid(conf: benedict) -> bool:
-            return (f'{part}' in conf.keys() and 
-                    set(config[f'{part}'].keys()) == set(conf.get(f'{part}', default={}).keys()))
+    for part, sub in config.items():
+        VALIDATORS[part] = _make_validator(part, sub)
+        _LAZY_VALIDATORS.pop(part, None)
+
+
+def _make_validator(part: str, sub: Any) -> Callable[[dict], bool]:
+    """
+    Creates a validator checking that a part of the configuration has the same keys as the given one.
+
+    :param part: The part of the configuration to validate.
+    :param sub: The reference content of the part.
+
+    :return: The validator.
+    :rtype: Callable[[dict], bool]
+    """
+    expected = frozenset(sub.keys()) if isinstance(sub, dict) else frozenset()
+
+    def valid(conf: benedict) -> bool:
+        got = conf.get(part)
+        return isinstance(got, dict) and expected == frozenset(got.keys())
 
-        VALIDATORS[part] = valid
+    return valid
 
 
+def _get_validator(part: str) -> Callable[[dict], bool] | None:
+    """
+    Returns the validator of a part of the configuration, creating it from the default config on first use.
+
+    Validators created this way are rebuilt once the default config has been extended.
+
+    :param part: The part of the configuration to validate.
+
+    :return: The validator, or None if the part is not in the default config.
+    :rtype: Callable[[dict], bool] | None
+    """
+    valid = dict.get(VALIDATORS, part)
+    stale = _LAZY_VALIDATORS.get(part, _DEFAULTS_VERSION) != _DEFAULTS_VERSION
+    if (valid is None or stale) and part in _VALIDATED_CONFIG_REF:
+        valid = VALIDATORS[part] = _make_validator(part, _VALIDATED_CONFIG_REF[part])
+        _LAZY_VALIDATORS[part] = _DEFAULTS_VERSION
+
+    return valid
+
+
+class _Validators(dict):
+    """
+    Validators by part of the configuration, created from the default config on first lookup.
+    """
+    def __getitem__(self, part: str) -> Callable[[dict], bool]:
+        if _LAZY_VALIDATORS.get(part, _DEFAULTS_VERSION) != _DEFAULTS_VERSION:
+            # Created from defaults that have been extended since
+            super().pop(part, None)
+        return super().__getitem__(part)
+
+    def __missing__(self, part: str) -> Callable[[dict], bool]:
+        if (valid := _get_validator(part)) is None:
+            raise KeyError(part)
+        return valid
+
+    def get(self, part: str, default: Any = None) -> Any:
+        try:
+            return self[part]
+        except KeyError:
+            return default
+
+
+VALIDATORS: Dict[str, Callable[[dict], bool]] = _Validators()
+
 extend_default_config({ 'config': { 'file': 'config', 'directory': './conf' } })
-extend_default_validators(DEFAULT_CONFIG)
 
 
 class BaseConfig:
@@ -89,55 +451,137 @@ class BaseConfig:
         if not isinstance(default_conf, benedict) and not isinstance(default_conf, dict):
             raise AttributeError('Default config must be dict or benedict.')
         
-        self.defaults = benedict(default_conf)
+        self.defaults = default_conf if isinstance(default_conf, benedict) else benedict(default_conf)
 
         cfg_dir = config_dir or self.defaults.find(['config.directory'], default='./conf')
-        self.config_dir = os.path.normpath(os.path.join(os.getcwd(), cfg_dir))
-        if not os.path.exists(self.config_dir):
-            logger.warning(f'Configuration folder "{cfg_dir}" does not exist')
-            os.makedirs(self.config_dir)
+        config_path = Path(cfg_dir).expanduser().resolve()
+        self.config_dir = str(config_path)
+        try:
+            config_path.mkdir(parents=True)
+        except FileExistsError:
+            pass
+        else:
+            logger.warning(f'Configuration folder "{cfg_dir}" did not exist')
             logger.success(f'Configuration folder "{cfg_dir}" created')
 
-        self.store = benedict()
-
-        self.load()
-
-        self.generate_dynamic_find_methods()
+        self._section_hash: Dict[str, Tuple[bytes, int, int]] = {}
+        self._clear_store()
+
+        self._index_sections()
+
+    def _get_sections(self) -> Tuple[str, ...]:
+        # Read from the defaults on every call, as they may be changed in place after construction
+        sections = _get_path(self.defaults, ('config', 'sections'), default=())
+        return tuple(sections) if isinstance(sections, (list, tuple)) else ()
+
+    def _clear_store(self):
+        # The store is a benedict view on a plain dict, merged and walked directly
+        self._store = benedict({})
+        self._unloaded: List[str] = []
+        self._merged: Tuple[Tuple[str, bytes], ...] | None = None
+
+    def _merge_files(self, files: List[Tuple[str, os.stat_result | None]]):
+        # Merging again the very files merged last into an unmodified store (see _touch) is a no-op
+        loaded = [ (path, *_load_toml(path, st)) for path, st in files ]
+        merged = tuple((path, digest) for path, digest, _ in loaded)
+        if not merged or merged == self._merged:
+            return
+
+        for _, _, parsed in loaded:
+            _deep_merge(self._store.dict(), parsed)
+        self._merged = merged
+
+    def _touch(self):
+        # The store no longer reflects the merged files, they must be merged again on update
+        self._merged = None
+
+    def _index_sections(self):
+        # Only locate the section files, they are parsed on first access
+        self._clear_store()
+        matcher = _section_matcher(self._get_sections())
+        with os.scandir(self.config_dir) as it:
+            self._unloaded = [ e.path for e in it if matcher(e.name) and e.is_file() ]
+
+    def _load_pending(self):
+        # Any file may hold any table, so all the pending files are loaded together
+        paths, self._unloaded = self._unloaded, []
+        self._merge_files([ (path, None) for path in paths if os.path.isfile(path) ])
+
+    @property
+    def store(self) -> benedict:
+        # Section files are only parsed once the store is accessed
+        self._load_pending()
+        return self._store
+
+    @store.setter
+    def store(self, value: benedict):
+        self._store = value
+        self._unloaded = []
+        self._merged = None
 
     def load(self, files: List[str] | None = None):
         # Initialize config using default values
-        self.store = benedict()
+        self._clear_store()
 
-        self.update(files or self.defaults.find(['config.sections'], default=[]))
+        self.update(files or self._get_sections())
 
         return self
 
     reload = load
 
     def reset(self):
-        sections = self.defaults.find(['config.sections'], default=[])
-        deletion = { s: False for s in sections }
-        for s in [ s for s in os.listdir(self.config_dir) if s in [ f'{s}.toml' for s in sections ] ]:
-            if (input(f'{s} already exists. Are you sure that you want to delete it? Y/[N] ') or 'N') == 'Y':
-                os.remove(os.path.join(self.config_dir, s))
-            else:
-                deletion[f] = False
-        
-        if not all(list(deletion.values())):
+        sections = self._get_sections()
+        matcher = _section_matcher(tuple(sections))
+        with os.scandir(self.config_dir) as it:
+            entries = [ e for e in it if matcher(e.name) ]
+        entries.sort(key=lambda e: e.name)
+        deletion = { e.name: False for e in entries }
+        for e in self._select_deletions(entries):
+            os.remove(e.path)
+            deletion[e.name] = True
+
+        if not all(deletion.values()):
             self.reload()
             logger.debug('Configuration has been partly deleted')
         else:
-            self.store = benedict()
+            self._clear_store()
             logger.success('Configuration has been fully deleted')
 
         return self
 
+    def _select_deletions(self, entries: List[os.DirEntry]) -> List[os.DirEntry]:
+        # A single confirmation for all the files, with an optional selection
+        if not entries:
+            return []
+
+        print(f'Existing configuration files: {", ".join(e.name for e in entries)}')
+        answer = (input(f'Delete these {len(entries)} files? [a]ll/[n]one/[s]elect ') or 'n').strip().lower()
+        if answer in ('a', 'y'):
+            return entries
+        if answer != 's':
+            return []
+
+        for i, e in enumerate(entries, 1):
+            print(f'{i}. {e.name}')
+        selected = set()
+        for index in input('Files to delete (comma-separated numbers): ').split(','):
+            if (index := index.strip()).isdigit() and 1 <= int(index) <= len(entries):
+                selected.add(int(index) - 1)
+            elif index:
+                logger.warning(f'Ignoring invalid selection "{index}"')
+
+        return [ e for i, e in enumerate(entries) if i in selected ]
+
     def update(self, sections: List[str] | None = None):
-        sections = sections or self.defaults.find(['config.sections'], default=[])
+        sections = sections or self._get_sections()
+        matcher = _section_matcher(tuple(sections))
         # Finding configuration files in config folder
-        if config_files := [ f for f in os.listdir(self.config_dir) if re.search(fr'^({"|".join(sections)})\.toml$', f) ]:
-            # Merging config files with defaults
-            self.store.merge(*[ benedict.from_toml(os.path.join(self.config_dir, f)) for f in config_files ])
+        with os.scandir(self.config_dir) as it:
+            entries = [ e for e in it if matcher(e.name) and e.is_file() ]
+        # Pending files come first, so the files given to update() take precedence over them
+        self._load_pending()
+        # Merging config files with defaults
+        self._merge_files([ (e.path, e.stat()) for e in entries ])
 
         return self
 
@@ -145,69 +589,115 @@ class BaseConfig:
         if len(args) == 0:
             return self.store
 
-        keypath = args[0] if len(args) == 1 else '.'.join(args)
+        keys = _split_args(args)
+
+        if _needs_benedict(keys):
+            # List indexes are only understood by benedict keypaths
+            keypath = list(keys)
+            default = kwargs.get('default', self.defaults.find([keypath], default=None))
+            return self.store.find([keypath], default=default)
 
-        default = kwargs.get('default', self.defaults.find([keypath], default=None))
+        value = _get_path(self.store, keys)
+        if value is _MISSING:
+            value = kwargs['default'] if 'default' in kwargs else _get_path(self.defaults, keys, default=None)
 
-        return self.store.find([keypath], default=default)
+        if isinstance(value, dict) and not isinstance(value, benedict):
+            value = benedict(value)
+
+        return value
 
     find = get
 
-    def generate_dynamic_find_methods(self):
-        def create_method(method_name):
-            def method(self, *args, **kwargs):
-                return self.find(method_name, *args, **kwargs)
-            return method
+    def validate(self, section: str) -> bool:
+        if (valid := _get_validator(section)) is None:
+            raise KeyError(f'No validator for "{section}"')
+
+        return valid(self.store)
 
-        for method_name in self.defaults.find(['config.sections'], default=list(self.defaults.keys())):
-            generated_method = create_method(method_name)
-            setattr(self.__class__, method_name, generated_method)
+    def __getattr__(self, name):
+        # Sections are exposed as find methods, e.g. config.db('host')
+        if 'defaults' in self.__dict__ and '*' not in name:
+            if name in (self._get_sections() or self.defaults.keys()):
+                return partial(self.find, name)
+        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
 
     def set(self, *args):
         if len(args) < 2:
             raise RuntimeError('Setting config value requires at least 2 arguments (key, value)')
 
-        keypath = args[0] if len(args) == 2 else '.'.join(args[:-1])
+        keys = _split_args(args[:-1])
         value = args[-1]
 
-        self.store[keypath] = value
+        if _needs_benedict(keys):
+            # List indexes are only understood by benedict keypaths
+            self.store[list(keys)] = value
+        else:
+            _set_path(self.store, keys, value)
+        self._touch()
 
         return self
 
+    def _get_flat_defaults(self) -> Dict[Tuple[str, ...], Any]:
+        # Not cached: the defaults may be changed in place, and delta saves walk the whole store anyway
+        return dict(_leaves(self.defaults))
+
+    def _expand_sections(self, sections: List[str], data: benedict) -> List[str]:
+        # Families are expanded to the matching tables of the data and the matching files
+        expanded = {}
+        for section in sections:
+            if '*' not in section:
+                expanded[section] = None
+                continue
+
+            matcher = _section_matcher((section,))
+            names = set(_match_tables(data, _split_key(section)))
+            with os.scandir(self.config_dir) as it:
+                names.update(e.name[:-len('.toml')] for e in it if matcher(e.name) and e.is_file())
+            expanded.update(dict.fromkeys(sorted(names)))
+
+        return list(expanded)
+
     def save(self, 
              sections: List[str] | None = None, 
              mode: Literal['asis', 'full', 'delta'] = 'asis'):
         """ Saving the configuration files """
-        sections = sections or self.defaults.find(['config.sections'], default=[])
+        sections = sections or self._get_sections()
 
-        data = benedict()
         if mode == 'full':
-            data.merge(self.defaults.clone())
-
-        data.merge(self.store.clone())
-
-        if mode == 'delta':
-            fdata = data.flatten(separator='$$')
-            data = benedict()
-            fdefault = self.defaults.flatten(separator='$$')
-            for k in fdata.keypaths():
-                if k not in fdefault:
-                    logger.debug(f'{k} not in defaults')
-                    data[k.replace('$$', '.')] = fdata[k]
-                elif fdata[k] != fdefault[k]:
-                    logger.debug(f'{fdata[k]} != {fdefault[k]}')
-                    data[k.replace('$$', '.')] = fdata[k]
+            data = benedict(_deep_merge(_deep_merge({}, self.defaults), self.store))
+        elif mode == 'delta':
+            fdefault = self._get_flat_defaults()
+            delta = benedict()
+            for keys, value in _leaves(self.store):
+                default = fdefault.get(keys, _MISSING)
+                if default is _MISSING:
+                    logger.debug(f'{".".join(keys)} not in defaults')
+                    delta[keys] = value
+                elif value != default:
+                    logger.debug(f'{value} != {default}')
+                    delta[keys] = value
+            data = delta
+        else:
+            data = self.store
 
         stored = 0
         if data:
-            for section in sections:
+            for section in self._expand_sections(sections, data):
                 path = os.path.join(self.config_dir, f'{section}.toml')
                 if section in data:
-                    data.subset(section).to_toml(filepath=path)
+                    payload = data.subset(section).to_toml().encode('utf-8')
+                    digest = hashlib.blake2b(payload, digest_size=16).digest()
+                    if self._section_hash.get(path) == (digest, *_file_signature(path)):
+                        logger.debug(f'Configuration "{section}" unchanged')
+                    else:
+                        with open(path, 'wb') as fh:
+                            fh.write(payload)
+                        self._section_hash[path] = (digest, *_file_signature(path))
+                        logger.debug(f'Configuration "{section}" successfully stored')
                     stored += 1
-                    logger.debug(f'Configuration "{section}" successfully stored')
                 elif mode == 'delta' and os.path.exists(path):
                     os.remove(path)
+                    self._section_hash.pop(path, None)
 
         return stored
 
@@ -215,10 +705,17 @@ class BaseConfig:
         return self.store[key]
 
     def __setitem__(self, key, value):
-        self.store[key] = value
+        # Writing through _set_path keeps the store plain dicts, benedict would store benedict nodes
+        keys = _split_args((key,))
+        if _needs_benedict(keys):
+            self.store[key] = value
+        else:
+            _set_path(self.store, keys, value)
+        self._touch()
 
     def __delitem__(self, key):
         del self.store[key]
+        self._touch()
 
     def __iter__(self):
         return iter(self.store)
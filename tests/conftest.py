@@ -1 +1,19 @@
 import pytest
+
+
+@pytest.fixture
+def restore_globals():
+    """ Restores the default config and validators changed by a test """
+    from ez_config_mgt import core
+    defaults = core.DEFAULT_CONFIG.clone()
+    validators = dict(core.VALIDATORS)
+    lazy = dict(core._LAZY_VALIDATORS)
+
+    yield
+
+    core.DEFAULT_CONFIG.clear()
+    core.DEFAULT_CONFIG.merge(defaults)
+    dict.clear(core.VALIDATORS)
+    dict.update(core.VALIDATORS, validators)
+    core._LAZY_VALIDATORS.clear()
+    core._LAZY_VALIDATORS.update(lazy)
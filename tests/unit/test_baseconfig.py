@@ -3,6 +3,7 @@
 # And slightly adjusted by Christophe Druet
 
 import pytest
+import tomllib
 from benedict import benedict
 
 
@@ -190,4 +191,355 @@ class TestBaseConfig:
         base_config = BaseConfig(config_dir=config_dir)
 
         # Assertion
-        assert os.path.exists(base_config.config_dir)
\ No newline at end of file
+        assert os.path.exists(base_config.config_dir)
+
+    # Reuse parsed TOML files until they change on disk
+    def test_update_reuses_unchanged_toml_files(self, tmp_path):
+        from ez_config_mgt.core import BaseConfig
+        from unittest.mock import patch
+
+        (tmp_path / 'db.toml').write_text('[db]\nhost = "localhost"\n')
+        config = BaseConfig(default_conf={'config': {'sections': ['db']}}, config_dir=str(tmp_path))
+        assert config.get('db.host') == 'localhost'
+
+        with patch.object(tomllib, 'loads', side_effect=AssertionError('file parsed again')):
+            config.reload()
+        assert config.get('db.host') == 'localhost'
+
+        (tmp_path / 'db.toml').write_text('[db]\nhost = "remote.example.com"\n')
+        config.reload()
+        assert config.get('db.host') == 'remote.example.com'
+
+    # Keep the files the user does not select for deletion during reset
+    def test_reset_keeps_refused_files(self, tmp_path):
+        from ez_config_mgt.core import BaseConfig
+        import builtins
+        from unittest.mock import patch
+
+        (tmp_path / 'db.toml').write_text('[db]\nhost = "localhost"\n')
+        (tmp_path / 'app.toml').write_text('[app]\nname = "demo"\n')
+        config = BaseConfig(default_conf={'config': {'sections': ['db', 'app']}}, config_dir=str(tmp_path))
+
+        with patch.object(builtins, 'input', side_effect=['s', '2']):
+            config.reset()
+
+        assert not (tmp_path / 'db.toml').exists()
+        assert (tmp_path / 'app.toml').exists()
+        assert config.get('db') is None
+        assert config.get('app.name') == 'demo'
+
+    # Retrieve nested values, falling back on defaults then on the given default
+    def test_get_nested_values_and_defaults(self):
+        from ez_config_mgt.core import BaseConfig
+        config = BaseConfig(default_conf={'db': {'host': 'localhost', 'port': 5432}}, config_dir='./test_conf')
+        config.set('db', 'host', 'remote.example.com')
+
+        assert config.get('db.host') == 'remote.example.com'
+        assert config.get('db', 'host') == 'remote.example.com'
+        assert config.get('db.port') == 5432
+        assert config.get('db.user') is None
+        assert config.get('db.user', default='admin') == 'admin'
+        assert config.get('db.host.name') is None
+        assert isinstance(config.get('db'), benedict)
+
+    # Retrieve values with list or tuple keypaths
+    def test_get_with_list_and_tuple_keypaths(self):
+        from ez_config_mgt.core import BaseConfig
+        config = BaseConfig(default_conf={'db': {'port': 5432}}, config_dir='./test_conf')
+        config.set('db', 'host', 'h')
+        config.set('db', 'replicas', [{'host': 'r'}])
+
+        assert config.get(['db', 'host']) == 'h'
+        assert config.get(('db', 'host')) == 'h'
+        assert config.get(['db', 'port']) == 5432
+        assert config.get(['db', 'replicas[0]', 'host']) == 'r'
+        assert config.get(['db', 'user'], default='admin') == 'admin'
+
+    # Set values with list or tuple keypaths, rejecting keys containing the separator
+    def test_set_with_list_keypaths_and_invalid_keys(self):
+        from ez_config_mgt.core import BaseConfig
+        config = BaseConfig(default_conf={}, config_dir='./test_conf')
+        config.set(['db', 'port'], 1)
+        config.set(('db', 'host'), 'h')
+        config.set(['db', 'replicas'], [{'host': 'r'}])
+        config.set(['db', 'replicas[0]', 'host'], 's')
+        assert config.get('db.port') == 1
+        assert config.get('db.host') == 'h'
+        assert config.get('db.replicas[0].host') == 's'
+
+        with pytest.raises(ValueError):
+            config.set('a', { 'b.c': 1 })
+        with pytest.raises(ValueError):
+            config['a'] = { 'b': { 'c.d': 1 } }
+
+    # Each validator checks its own part of the configuration
+    def test_validators_check_their_own_part(self, restore_globals):
+        from ez_config_mgt.core import extend_default_validators, VALIDATORS
+        extend_default_validators({ 'db': { 'host': 'localhost' }, 'app': { 'name': 'demo', 'debug': False } })
+
+        conf = benedict({ 'db': { 'host': 'remote.example.com' }, 'app': { 'name': 'other' } })
+        assert VALIDATORS['db'](conf)
+        assert not VALIDATORS['app'](conf)
+        assert not VALIDATORS['db'](benedict())
+
+    # Only store the values differing from defaults in 'delta' mode
+    def test_save_delta_only_stores_changed_values(self, tmp_path):
+        from ez_config_mgt.core import BaseConfig
+        defaults = { 'config': { 'sections': ['db'] }, 'db': { 'host': 'localhost', 'port': 5432 } }
+        config = BaseConfig(default_conf=defaults, config_dir=str(tmp_path))
+        config.set('db', 'host', 'localhost')
+        config.set('db', 'port', 6543)
+
+        assert config.save(mode='delta') == 1
+        assert benedict.from_toml(str(tmp_path / 'db.toml')) == { 'db': { 'port': 6543 } }
+
+    # Skip rewriting sections whose content did not change since the last save
+    def test_save_skips_unchanged_sections(self, tmp_path):
+        from ez_config_mgt.core import BaseConfig
+        import builtins
+        from unittest.mock import patch
+
+        config = BaseConfig(default_conf={ 'config': { 'sections': ['db'] } }, config_dir=str(tmp_path))
+        config.set('db', 'host', 'localhost')
+        assert config.save() == 1
+
+        with patch.object(builtins, 'open', side_effect=AssertionError('file written again')):
+            assert config.save() == 1
+
+        config.set('db', 'host', 'remote.example.com')
+        assert config.save() == 1
+        assert benedict.from_toml(str(tmp_path / 'db.toml'))['db.host'] == 'remote.example.com'
+
+    # Rewrite sections whose file was changed on disk since the last save
+    def test_save_rewrites_files_changed_externally(self, tmp_path):
+        from ez_config_mgt.core import BaseConfig
+        config = BaseConfig(default_conf={ 'config': { 'sections': ['db'] } }, config_dir=str(tmp_path))
+        config.set('db', 'host', 'a')
+        assert config.save() == 1
+
+        (tmp_path / 'db.toml').write_text('[db]\nhost = "b"\n')
+        config.reload()
+        assert config.get('db.host') == 'b'
+
+        config.set('db', 'host', 'a')
+        assert config.save() == 1
+        assert benedict.from_toml(str(tmp_path / 'db.toml'))['db.host'] == 'a'
+
+    # Parse section files only when the configuration is first accessed
+    def test_sections_are_loaded_lazily(self, tmp_path):
+        from ez_config_mgt.core import BaseConfig
+        from unittest.mock import patch
+
+        (tmp_path / 'db.toml').write_text('[db]\nhost = "localhost"\n')
+        (tmp_path / 'app.toml').write_text('[app]\nname = "demo"\n')
+        with patch.object(tomllib, 'loads', wraps=tomllib.loads) as loads:
+            config = BaseConfig(default_conf={'config': {'sections': ['db', 'app']}}, config_dir=str(tmp_path))
+            assert loads.call_count == 0
+
+            assert config.get('db', 'host') == 'localhost'
+            assert loads.call_count == 2
+
+            assert len(config) == 2
+            assert loads.call_count == 2
+
+    # Expose sections as find methods on each instance only
+    def test_sections_as_find_methods(self):
+        from ez_config_mgt.core import BaseConfig
+        config = BaseConfig(default_conf={ 'config': { 'sections': ['db'] }, 'db': { 'host': 'localhost' } }, config_dir='./test_conf')
+        assert config.db('host') == 'localhost'
+
+        other = BaseConfig(default_conf={ 'app': { 'name': 'demo' } }, config_dir='./test_conf')
+        assert other.app('name') == 'demo'
+        with pytest.raises(AttributeError):
+            other.db
+
+    # Match section families with wildcards and section names literally otherwise
+    def test_update_with_section_families(self, tmp_path):
+        from ez_config_mgt.core import BaseConfig
+        (tmp_path / 'db.main.toml').write_text('[db.main]\nhost = "localhost"\n')
+        (tmp_path / 'db.replica.toml').write_text('[db.replica]\nhost = "replica.example.com"\n')
+        (tmp_path / 'dbXmain.toml').write_text('[dbXmain]\nhost = "wrong"\n')
+
+        config = BaseConfig(default_conf={'config': {'sections': ['db.*']}}, config_dir=str(tmp_path))
+        assert config.get('db.main.host') == 'localhost'
+        assert config.get('db.replica.host') == 'replica.example.com'
+
+        config = BaseConfig(default_conf={'config': {'sections': ['db.main']}}, config_dir=str(tmp_path))
+        assert config.get('db.main.host') == 'localhost'
+        assert config.get('db.replica') is None
+        assert config.get('dbXmain') is None
+
+    # Save section families to one file per matching table
+    def test_save_with_section_families(self, tmp_path):
+        from ez_config_mgt.core import BaseConfig
+        (tmp_path / 'db.main.toml').write_text('[db.main]\nhost = "localhost"\n')
+        (tmp_path / 'db.replica.toml').write_text('[db.replica]\nhost = "replica.example.com"\n')
+        defaults = {'config': {'sections': ['db.*']}}
+
+        config = BaseConfig(default_conf=defaults, config_dir=str(tmp_path))
+        config.set('db', 'main', 'host', 'remote.example.com')
+        config.set('db', 'port', 5432)
+        assert config.save() == 2
+        assert not (tmp_path / 'db.port.toml').exists()
+        assert not hasattr(config, 'db.*')
+        assert BaseConfig(default_conf=defaults, config_dir=str(tmp_path)).get('db.main.host') == 'remote.example.com'
+
+        del config['db.replica']
+        assert config.save(mode='delta') == 1
+        assert not (tmp_path / 'db.replica.toml').exists()
+        assert (tmp_path / 'db.main.toml').exists()
+
+    # Confirm the deletion of all files at once during reset
+    def test_reset_deletes_all_files_with_single_answer(self, tmp_path):
+        from ez_config_mgt.core import BaseConfig
+        import builtins
+        from unittest.mock import patch
+
+        (tmp_path / 'db.toml').write_text('[db]\nhost = "localhost"\n')
+        (tmp_path / 'app.toml').write_text('[app]\nname = "demo"\n')
+        config = BaseConfig(default_conf={'config': {'sections': ['db', 'app']}}, config_dir=str(tmp_path))
+
+        with patch.object(builtins, 'input', return_value='a') as prompt:
+            config.reset()
+
+        assert prompt.call_count == 1
+        assert not list(tmp_path.iterdir())
+        assert len(config) == 0
+
+    # Create validators from the default config on first validation
+    def test_validate_registers_validators_lazily(self, restore_globals):
+        from ez_config_mgt.core import BaseConfig, VALIDATORS, extend_default_config
+        extend_default_config({ 'cache': { 'ttl': 60 } })
+        assert 'cache' not in VALIDATORS
+
+        config = BaseConfig(config_dir='./test_conf')
+        assert not config.validate('cache')
+        assert 'cache' in VALIDATORS
+
+        config.set('cache', 'ttl', 30)
+        assert config.validate('cache')
+        with pytest.raises(KeyError):
+            config.validate('unknown')
+
+        extend_default_config({ 'cache': { 'size': 10 } })
+        assert not config.validate('cache')
+        config.set('cache', 'size', 20)
+        assert config.validate('cache')
+
+    # Look validators up directly, creating them from the default config
+    def test_validators_lookup(self, restore_globals):
+        from ez_config_mgt.core import VALIDATORS, extend_default_config
+        assert VALIDATORS['config'](benedict({ 'config': { 'file': 'app', 'directory': './app' } }))
+        with pytest.raises(KeyError):
+            VALIDATORS['unknown']
+        assert VALIDATORS.get('unknown') is None
+
+        extend_default_config({ 'config': { 'sections': [] } })
+        assert not VALIDATORS['config'](benedict({ 'config': { 'file': 'app', 'directory': './app' } }))
+
+    # Keep cached TOML content untouched by changes made to the store
+    def test_store_changes_do_not_leak_into_cached_files(self, tmp_path):
+        from ez_config_mgt.core import BaseConfig
+        (tmp_path / 'db.toml').write_text('[db]\nhost = "localhost"\nreplicas = ["a"]\n')
+        config = BaseConfig(default_conf={'config': {'sections': ['db']}}, config_dir=str(tmp_path))
+        config.set('db', 'host', 'remote.example.com')
+        config.get('db.replicas').append('b')
+
+        config.reload()
+        assert config.get('db.host') == 'localhost'
+        assert config.get('db.replicas') == ['a']
+
+    # Keep plain dicts in the store and references to them valid across updates
+    def test_store_keeps_plain_dicts_and_references(self, tmp_path):
+        from ez_config_mgt.core import BaseConfig
+        (tmp_path / 'db.toml').write_text('[db]\nhost = "localhost"\n')
+        config = BaseConfig(default_conf={'config': {'sections': ['db']}}, config_dir=str(tmp_path))
+        config['app.logging'] = benedict({ 'level': 'INFO' })
+        assert type(config.store.dict()['app']['logging']) is dict
+
+        app = config.get('app')
+        (tmp_path / 'db.toml').write_text('[db]\nhost = "remote.example.com"\n')
+        config.update()
+        app['name'] = 'demo'
+
+        assert config.get('app.name') == 'demo'
+        assert config.get('app.logging.level') == 'INFO'
+        assert config.get('db.host') == 'remote.example.com'
+
+    # Skip merging files unchanged since they were merged into an unmodified store
+    def test_update_skips_files_already_merged(self, tmp_path):
+        from ez_config_mgt.core import BaseConfig
+        from unittest.mock import patch
+
+        (tmp_path / 'db.toml').write_text('[db]\nhost = "localhost"\n')
+        config = BaseConfig(default_conf={'config': {'sections': ['db']}}, config_dir=str(tmp_path))
+        config.update()
+        with patch('ez_config_mgt.core._deep_merge', side_effect=AssertionError('file merged again')):
+            config.update()
+
+        config.set('db', 'host', 'remote.example.com')
+        config.update()
+        assert config.get('db.host') == 'localhost'
+
+        del config['db']
+        config.update()
+        assert config.get('db.host') == 'localhost'
+
+        config.store = benedict({})
+        config.update()
+        assert config.get('db.host') == 'localhost'
+
+        (tmp_path / 'db.toml').write_text('[db]\nhost = "replica.example.com"\n')
+        config.update()
+        assert config.get('db.host') == 'replica.example.com'
+
+    # Follow changes made in place to the defaults after construction
+    def test_defaults_changed_in_place(self, tmp_path):
+        from ez_config_mgt.core import BaseConfig
+        (tmp_path / 'db.toml').write_text('[db]\nhost = "localhost"\n')
+        (tmp_path / 'app.toml').write_text('[app]\nname = "demo"\n')
+        config = BaseConfig(default_conf={'config': {'sections': ['db']}, 'app': {'name': 'default'}}, config_dir=str(tmp_path))
+        config.update()
+        assert config.get('app.name') == 'default'
+
+        config.defaults['config.sections'] = ['db', 'app']
+        config.update()
+        assert config.get('app.name') == 'demo'
+        assert config.app('name') == 'demo'
+
+        config.defaults['app.name'] = 'demo'
+        config.save(mode='delta')
+        assert (tmp_path / 'db.toml').exists()
+        assert not (tmp_path / 'app.toml').exists()
+
+    # Let the files given to update() take precedence over those still pending
+    def test_update_takes_precedence_over_pending_files(self, tmp_path):
+        from ez_config_mgt.core import BaseConfig
+        (tmp_path / 'a.toml').write_text('[x]\nk = "from_a"\n')
+        (tmp_path / 'b.toml').write_text('[x]\nk = "from_b"\n')
+        config = BaseConfig(default_conf={'config': {'sections': ['a', 'b']}}, config_dir=str(tmp_path))
+        assert config.update(['a']).get('x.k') == 'from_a'
+
+    # Find tables whatever the file holding them when loading lazily
+    def test_lazy_loading_with_several_tables_per_file(self, tmp_path):
+        from ez_config_mgt.core import BaseConfig
+        (tmp_path / 'db.toml').write_text('[db]\nhost = "localhost"\n\n[other]\nx = 1\n')
+        config = BaseConfig(default_conf={'config': {'sections': ['db']}}, config_dir=str(tmp_path))
+        assert config.get('other') == { 'x': 1 }
+
+        config = BaseConfig(default_conf={'config': {'sections': ['db']}}, config_dir=str(tmp_path))
+        assert config.store['db.host'] == 'localhost'
+        assert config['other.x'] == 1
+
+    # Access items with list or tuple keypaths
+    def test_item_access_with_tuple_keys(self, tmp_path):
+        from ez_config_mgt.core import BaseConfig
+        (tmp_path / 'db.toml').write_text('[db]\nhost = "h"\n')
+        config = BaseConfig(default_conf={'config': {'sections': ['db']}}, config_dir=str(tmp_path))
+        assert config[('db', 'host')] == 'h'
+
+        config[['db', 'port']] = 5432
+        assert config.get('db.port') == 5432
+
+        del config[('db', 'port')]
+        assert config.get('db.port') is None